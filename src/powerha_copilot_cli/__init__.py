@@ -17,7 +17,16 @@ Usage:
 __version__ = "1.0.0"
 __author__ = "ZIEMACS AI"
 
-from powerha_copilot_cli.client import PowerHACopilotClient
-from powerha_copilot_cli.config import Config
-
 __all__ = ["PowerHACopilotClient", "Config", "__version__"]
+
+
+def __getattr__(name: str):
+    # Resolve the public classes on first access so that importing the
+    # package (e.g. for __version__) doesn't pull in httpx, yaml or keyring.
+    if name == "PowerHACopilotClient":
+        from powerha_copilot_cli.client import PowerHACopilotClient
+        return PowerHACopilotClient
+    if name == "Config":
+        from powerha_copilot_cli.config import Config
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
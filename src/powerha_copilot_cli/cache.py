@@ -0,0 +1,70 @@
+"""
+Short-lived response cache for PowerHA Copilot CLI.
+
+Scripts and shell completions often repeat the same read-only command
+within a second or two. Responses are kept on disk for RESPONSE_TTL
+seconds so those repeats skip the round trip to the API server.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Any, Optional
+
+from powerha_copilot_cli.config import CONFIG_DIR, Config, _atomic_write
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+CACHE_DIR = CONFIG_DIR / "cache"
+RESPONSE_TTL = 1.0  # seconds
+
+
+def load(config: Config, op: str, *args: Any, ttl: float = RESPONSE_TTL) -> Optional[Any]:
+    """Get a cached response, or None if missing or older than ttl."""
+    path = _path(config, op, args)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        raw = path.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+
+
+def store(config: Config, op: str, *args: Any, data: Any) -> None:
+    """Cache a response; failures only cost a request next time."""
+    payload = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _prune()
+        _atomic_write(_path(config, op, args), payload)
+    except OSError:
+        pass
+
+
+def clear() -> None:
+    """Delete every cached response."""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+
+
+def _prune(ttl: float = RESPONSE_TTL) -> None:
+    """Delete cached responses older than ttl."""
+    cutoff = time.time() - ttl
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def _path(config: Config, op: str, args: tuple):
+    """Cache file for a request, keyed on server, API key, operation and arguments."""
+    key = json.dumps([config.base_url, config.get_api_key_fingerprint(), op, list(args)]).encode()
+    return CACHE_DIR / f"{hashlib.sha256(key).hexdigest()[:32]}.json"
@@ -6,11 +6,17 @@ All business logic runs on the server - this client just sends requests
 and displays responses.
 """
 
-import asyncio
-from typing import Any, AsyncIterator, Dict, List, Optional
+import contextlib
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
 from dataclasses import dataclass
 
-import httpx
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
 from powerha_copilot_cli.config import Config, get_config
 
@@ -23,6 +29,93 @@ class APIError(Exception):
     details: Optional[Dict[str, Any]] = None
 
 
+# Status codes whose body is not worth reading, with their fixed messages
+_STATUS_MESSAGES: Dict[int, str] = {
+    401: "Authentication required. Run 'powerha-copilot login' first.",
+    403: "Access denied. Check your permissions.",
+}
+
+
+# Server-sent events field prefix for payload lines
+_SSE_DATA_PREFIX = "data: "
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
+
+
+def _parse_body(response: "httpx.Response") -> Dict[str, Any]:
+    """Decode a JSON response body, treating an empty body as {}."""
+    content = response.content
+    if not content:
+        return {}
+    if orjson is not None:
+        return orjson.loads(content)
+    return response.json()
+
+
+def _json_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Request kwargs for a JSON body, pre-encoded with orjson when available."""
+    if orjson is not None:
+        return {"content": orjson.dumps(payload)}
+    return {"json": payload}
+
+
+def _parse_error_body(response: "httpx.Response") -> Dict[str, Any]:
+    """Decode an error body, tolerating empty and non-JSON (e.g. proxy HTML) pages."""
+    if response.headers.get("content-length") == "0":
+        return {}
+    try:
+        data = _parse_body(response)
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+# HTTP client reused by every PowerHACopilotClient on the current event
+# loop, so sequential `async with PowerHACopilotClient()` blocks keep their
+# keep-alive connections. A full AsyncClient (rather than a bare transport)
+# is shared so httpx still applies HTTP(S)_PROXY/NO_PROXY from the
+# environment. Clients are bound to a loop and replaced when the loop
+# changes (e.g. repeated asyncio.run() calls).
+_shared_pool: Optional[tuple] = None
+
+
+async def _shared_client() -> "httpx.AsyncClient":
+    """Get the pooled HTTP client for the running event loop."""
+    import asyncio
+
+    import httpx
+
+    global _shared_pool
+    loop = asyncio.get_running_loop()
+    if _shared_pool is None or _shared_pool[0] is not loop:
+        previous = _shared_pool
+        _shared_pool = (
+            loop,
+            httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30,
+                ),
+            ),
+        )
+        if previous is not None:
+            # Best effort: the old client's loop may already be closed
+            with contextlib.suppress(Exception):
+                await previous[1].aclose()
+    return _shared_pool[1]
+
+
+async def aclose_shared_client() -> None:
+    """Close the running event loop's pooled HTTP client, if it has one."""
+    import asyncio
+
+    global _shared_pool
+    if _shared_pool is not None and _shared_pool[0] is asyncio.get_running_loop():
+        client = _shared_pool[1]
+        _shared_pool = None
+        await client.aclose()
+
+
 class PowerHACopilotClient:
     """
     Async HTTP client for PowerHA Copilot API.
@@ -36,33 +129,44 @@ class PowerHACopilotClient:
     def __init__(self, config: Optional[Config] = None):
         """Initialize the client."""
         self.config = config or get_config()
-        self._client: Optional[httpx.AsyncClient] = None
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._base_url = self.config.base_url
+        self._user_agent = f"powerha-copilot-cli/{self.config.api_version}"
+        self._headers_cache: Optional[Dict[str, str]] = None
+        self._headers_version = -1
 
     async def __aenter__(self) -> "PowerHACopilotClient":
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            base_url=self.config.base_url,
-            timeout=self.config.timeout,
-            headers=self._get_headers(),
-        )
+        # The pooled client is shared, so base URL, headers and timeout are
+        # passed with each request rather than set on it
+        self._base_url = self.config.base_url
+        self._client = await _shared_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        # The pooled client outlives this one; see aclose_shared_client()
+        self._client = None
 
     def _get_headers(self) -> Dict[str, str]:
         """Get request headers with authentication."""
+        if (
+            self._headers_cache is not None
+            and self._headers_version == self.config.credentials_version
+        ):
+            return self._headers_cache
+
         headers = {
             "Content-Type": "application/json",
-            "User-Agent": f"powerha-copilot-cli/{self.config.api_version}",
+            "User-Agent": self._user_agent,
         }
 
         api_key = self.config.get_api_key()
         if api_key:
             headers["Authorization"] = f"Bearer {api_key}"
 
+        self._headers_cache = headers
+        self._headers_version = self.config.credentials_version
         return headers
 
     async def _request(
@@ -75,30 +179,41 @@ class PowerHACopilotClient:
         if not self._client:
             raise RuntimeError("Client not initialized. Use 'async with' context.")
 
-        try:
-            response = await self._client.request(method, endpoint, **kwargs)
-
-            if response.status_code == 401:
-                raise APIError(401, "Authentication required. Run 'powerha-copilot login' first.")
-
-            if response.status_code == 403:
-                raise APIError(403, "Access denied. Check your permissions.")
+        import httpx
 
-            if response.status_code >= 400:
-                error_data = response.json() if response.content else {}
-                raise APIError(
-                    response.status_code,
-                    error_data.get("message", f"Request failed: {response.status_code}"),
-                    error_data.get("details"),
-                )
-
-            return response.json() if response.content else {}
+        try:
+            response = await self._client.request(
+                method,
+                self._base_url + endpoint,
+                headers=self._get_headers(),
+                timeout=self.config.timeout,
+                **kwargs,
+            )
+
+            status_code = response.status_code
+            if status_code < 400:
+                return _parse_body(response)
+
+            message = _STATUS_MESSAGES.get(status_code)
+            if message is not None:
+                raise APIError(status_code, message)
+
+            error_data = _parse_error_body(response)
+            raise APIError(
+                status_code,
+                error_data.get("message", f"Request failed: {status_code}"),
+                error_data.get("details"),
+            )
 
         except httpx.ConnectError:
             raise APIError(0, f"Cannot connect to {self.config.api_url}. Is the server running?")
         except httpx.TimeoutException:
             raise APIError(0, "Request timed out. Try again or increase timeout.")
 
+    async def _post_json(self, endpoint: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """POST a JSON payload."""
+        return await self._request("POST", endpoint, **_json_body(payload))
+
     # -------------------------------------------------------------------------
     # Authentication
     # -------------------------------------------------------------------------
@@ -110,21 +225,19 @@ class PowerHACopilotClient:
         Returns:
             Dict with api_key and user info
         """
-        response = await self._request(
-            "POST",
+        response = await self._post_json(
             "/auth/login",
-            json={"username": username, "password": password},
+            {"username": username, "password": password},
         )
 
         # Store credentials
-        if "api_key" in response:
-            self.config.set_api_key(response["api_key"])
-        if "refresh_token" in response:
-            self.config.set_refresh_token(response["refresh_token"])
-        if "user" in response:
-            self.config.username = response["user"].get("username")
-            self.config.organization = response["user"].get("organization")
-            self.config.save()
+        user = response.get("user") or {}
+        self.config.batch_credential_update(
+            api_key=response.get("api_key"),
+            refresh_token=response.get("refresh_token"),
+            username=user.get("username"),
+            organization=user.get("organization"),
+        )
 
         return response
 
@@ -135,19 +248,17 @@ class PowerHACopilotClient:
         Returns:
             Dict with user info
         """
-        # Temporarily set the key to make the request
+        # Temporarily set the key to make the request; _get_headers()
+        # picks it up through the credentials version
         self.config.set_api_key(api_key)
 
-        # Update client headers
-        if self._client:
-            self._client.headers.update(self._get_headers())
-
         # Verify the key
         response = await self._request("GET", "/auth/me")
 
-        if "user" in response:
-            self.config.username = response["user"].get("username")
-            self.config.organization = response["user"].get("organization")
+        user = response.get("user")
+        if user is not None:
+            self.config.username = user.get("username")
+            self.config.organization = user.get("organization")
             self.config.save()
 
         return response
@@ -184,7 +295,7 @@ class PowerHACopilotClient:
         if conversation_id:
             payload["conversation_id"] = conversation_id
 
-        return await self._request("POST", "/chat", json=payload)
+        return await self._post_json("/chat", payload)
 
     async def chat_stream(
         self,
@@ -204,13 +315,20 @@ class PowerHACopilotClient:
         if conversation_id:
             payload["conversation_id"] = conversation_id
 
-        async with self._client.stream("POST", "/chat", json=payload) as response:
+        async with self._client.stream(
+            "POST",
+            self._base_url + "/chat",
+            headers=self._get_headers(),
+            timeout=self.config.timeout,
+            **_json_body(payload),
+        ) as response:
             if response.status_code != 200:
                 raise APIError(response.status_code, "Stream request failed")
 
             async for line in response.aiter_lines():
-                if line.startswith("data: "):
-                    yield line[6:]
+                # Blank lines separate SSE events and carry no data
+                if line and line.startswith(_SSE_DATA_PREFIX):
+                    yield line[_SSE_DATA_PREFIX_LEN:]
 
     # -------------------------------------------------------------------------
     # Cluster Operations
@@ -268,11 +386,7 @@ class PowerHACopilotClient:
         if target_node:
             payload["target_node"] = target_node
 
-        return await self._request(
-            "POST",
-            f"/clusters/{cluster_id}/failover",
-            json=payload,
-        )
+        return await self._post_json(f"/clusters/{cluster_id}/failover", payload)
 
     async def manage_resource_group(
         self,
@@ -347,4 +461,12 @@ def sync_client() -> PowerHACopilotClient:
 
 def run_async(coro):
     """Run an async function synchronously."""
-    return asyncio.get_event_loop().run_until_complete(coro)
+    import asyncio
+
+    async def run_and_close():
+        try:
+            return await coro
+        finally:
+            await aclose_shared_client()
+
+    return asyncio.run(run_and_close())
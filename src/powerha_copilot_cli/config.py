@@ -7,23 +7,28 @@ Handles:
 - User preferences
 """
 
+import functools
+import hashlib
 import os
 import json
+import tempfile
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Optional
 
-import keyring
-import yaml
-
 
 APP_NAME = "powerha-copilot-cli"
 CONFIG_DIR = Path.home() / ".powerha-copilot"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
+CONFIG_CACHE_FILE = CONFIG_DIR / "config.cache.json"
+CONFIG_CACHE_SCHEMA_VERSION = 2
 KEYRING_SERVICE = "powerha-copilot"
 
+# Persisted settings keyed by path, validated against the file's (mtime, size)
+_CONFIG_CACHE: dict[Path, tuple[int, int, dict]] = {}
+
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """PowerHA Copilot CLI configuration."""
 
@@ -35,10 +40,12 @@ class Config:
     theme: str = "dark"  # dark, light, auto
     output_format: str = "rich"  # rich, json, plain
     language: str = "en"
+    spinner: bool = True  # progress spinners on interactive terminals
 
     # Session Settings
     timeout: int = 30
     max_retries: int = 3
+    daemon_socket: Optional[str] = None  # set by `daemon start`
 
     # Feature Flags
     streaming: bool = True
@@ -48,54 +55,108 @@ class Config:
     username: Optional[str] = None
     organization: Optional[str] = None
 
+    # Keyring lookup memoized per instance (not persisted)
+    _api_key_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _api_key_loaded: bool = field(default=False, init=False, repr=False, compare=False)
+    _credentials_version: int = field(default=0, init=False, repr=False, compare=False)
+
     @classmethod
     def load(cls) -> "Config":
         """Load configuration from file."""
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE) as f:
-                data = yaml.safe_load(f) or {}
-                return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
-        return cls()
+        try:
+            st = CONFIG_FILE.stat()
+        except FileNotFoundError:
+            return cls()
+        if not st.st_size:
+            return cls()
+
+        cached = _CONFIG_CACHE.get(CONFIG_FILE)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cls(**cached[2])
+
+        data = _read_json_cache(st)
+        if data is None:
+            data = _parse_yaml(CONFIG_FILE.read_bytes())
+            data = {k: v for k, v in data.items() if k in _PERSISTED_FIELDS}
+            _write_json_cache(data, st)
+        _CONFIG_CACHE[CONFIG_FILE] = (st.st_mtime_ns, st.st_size, data)
+        return cls(**data)
 
     def save(self) -> None:
         """Save configuration to file."""
+        import yaml
+
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CONFIG_FILE, "w") as f:
-            yaml.dump(asdict(self), f, default_flow_style=False)
+        data = self.to_dict()
+        _atomic_write(
+            CONFIG_FILE,
+            yaml.dump(data, Dumper=_yaml_classes()[0], default_flow_style=False),
+        )
+
+        st = CONFIG_FILE.stat()
+        _write_json_cache(data, st)
+        _CONFIG_CACHE[CONFIG_FILE] = (st.st_mtime_ns, st.st_size, data)
+
+    def to_dict(self) -> dict:
+        """Get the persisted settings as a plain dict."""
+        return {name: getattr(self, name) for name in _PERSISTED_FIELDS}
 
     @property
     def base_url(self) -> str:
         """Get full API base URL."""
         return f"{self.api_url}/{self.api_version}"
 
+    @property
+    def credentials_version(self) -> int:
+        """Counter bumped whenever the stored API key changes."""
+        return self._credentials_version
+
     # -------------------------------------------------------------------------
     # Credential Management (using system keyring)
     # -------------------------------------------------------------------------
 
-    @staticmethod
-    def get_api_key() -> Optional[str]:
-        """Get API key from system keyring."""
-        try:
-            return keyring.get_password(KEYRING_SERVICE, "api_key")
-        except Exception:
-            return None
+    def get_api_key(self) -> Optional[str]:
+        """Get API key from system keyring (looked up once per instance)."""
+        if not self._api_key_loaded:
+            import keyring
 
-    @staticmethod
-    def set_api_key(api_key: str) -> None:
+            try:
+                self._api_key_cache = keyring.get_password(KEYRING_SERVICE, "api_key")
+            except Exception:
+                self._api_key_cache = None
+            self._api_key_loaded = True
+        return self._api_key_cache
+
+    def get_api_key_fingerprint(self) -> str:
+        """SHA-256 of the API key, to tell credentials apart without storing them."""
+        return hashlib.sha256((self.get_api_key() or "").encode()).hexdigest()
+
+    def set_api_key(self, api_key: str) -> None:
         """Store API key in system keyring."""
+        import keyring
+
         keyring.set_password(KEYRING_SERVICE, "api_key", api_key)
+        self._api_key_cache = api_key
+        self._api_key_loaded = True
+        self._credentials_version += 1
 
-    @staticmethod
-    def delete_api_key() -> None:
+    def delete_api_key(self) -> None:
         """Remove API key from system keyring."""
+        import keyring
+
         try:
             keyring.delete_password(KEYRING_SERVICE, "api_key")
         except keyring.errors.PasswordDeleteError:
             pass
+        self._api_key_cache = None
+        self._api_key_loaded = True
+        self._credentials_version += 1
 
     @staticmethod
     def get_refresh_token() -> Optional[str]:
         """Get refresh token from system keyring."""
+        import keyring
+
         try:
             return keyring.get_password(KEYRING_SERVICE, "refresh_token")
         except Exception:
@@ -104,11 +165,15 @@ class Config:
     @staticmethod
     def set_refresh_token(token: str) -> None:
         """Store refresh token in system keyring."""
+        import keyring
+
         keyring.set_password(KEYRING_SERVICE, "refresh_token", token)
 
     @staticmethod
     def delete_refresh_token() -> None:
         """Remove refresh token from system keyring."""
+        import keyring
+
         try:
             keyring.delete_password(KEYRING_SERVICE, "refresh_token")
         except keyring.errors.PasswordDeleteError:
@@ -119,14 +184,125 @@ class Config:
         return self.get_api_key() is not None
 
     def clear_credentials(self) -> None:
-        """Clear all stored credentials."""
-        self.delete_api_key()
-        self.delete_refresh_token()
-        self.username = None
-        self.organization = None
+        """Clear all stored credentials and cached API responses."""
+        from powerha_copilot_cli import cache
+
+        self.batch_credential_update(clear=True)
+        cache.clear()
+
+    def batch_credential_update(
+        self,
+        api_key: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+        username: Optional[str] = None,
+        organization: Optional[str] = None,
+        clear: bool = False,
+    ) -> None:
+        """
+        Apply several credential changes and write the config file once.
+
+        Args:
+            api_key: API key to store
+            refresh_token: Refresh token to store
+            username: Username to record
+            organization: Organization to record
+            clear: Remove stored credentials and user info first
+
+        Arguments left as None are not changed.
+        """
+        if clear:
+            self.delete_api_key()
+            self.delete_refresh_token()
+            self.username = None
+            self.organization = None
+
+        if api_key is not None:
+            self.set_api_key(api_key)
+        if refresh_token is not None:
+            self.set_refresh_token(refresh_token)
+        if username is not None:
+            self.username = username
+        if organization is not None:
+            self.organization = organization
+
         self.save()
 
 
+_PERSISTED_FIELDS = tuple(f.name for f in fields(Config) if f.init)
+
+
+def _parse_yaml(raw: bytes) -> dict:
+    """Parse config YAML, skipping the parser for blank or comment-only files."""
+    for line in raw.splitlines():
+        stripped = line.strip()
+        if stripped and not stripped.startswith(b"#"):
+            import yaml
+
+            return yaml.load(raw, Loader=_yaml_classes()[1]) or {}
+    return {}
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_classes() -> tuple:
+    """PyYAML (dumper, loader), preferring the LibYAML C bindings when built."""
+    try:
+        from yaml import CSafeDumper, CSafeLoader
+        return CSafeDumper, CSafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+        return SafeDumper, SafeLoader
+
+
+def _read_json_cache(yaml_stat: os.stat_result) -> Optional[dict]:
+    """Read the JSON sidecar if it was written from this exact YAML file."""
+    try:
+        with open(CONFIG_CACHE_FILE) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(cached, dict)
+        or cached.get("schema_version") != CONFIG_CACHE_SCHEMA_VERSION
+        or cached.get("source") != [yaml_stat.st_mtime_ns, yaml_stat.st_size]
+        or not isinstance(cached.get("config"), dict)
+    ):
+        return None
+    return {k: v for k, v in cached["config"].items() if k in _PERSISTED_FIELDS}
+
+
+def _write_json_cache(data: dict, yaml_stat: os.stat_result) -> None:
+    """Write the JSON sidecar; failures only cost a YAML parse next time."""
+    try:
+        _atomic_write(
+            CONFIG_CACHE_FILE,
+            json.dumps({
+                "schema_version": CONFIG_CACHE_SCHEMA_VERSION,
+                "source": [yaml_stat.st_mtime_ns, yaml_stat.st_size],
+                "config": data,
+            }),
+        )
+    except (OSError, TypeError, ValueError):
+        # Values JSON can't represent (e.g. a YAML date): go without a sidecar
+        pass
+
+
+def _atomic_write(path: Path, data: str | bytes) -> None:
+    """Write data to path via a temp file so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb" if isinstance(data, bytes) else "w") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get or create configuration."""
+    """Get or create configuration (one shared instance per process)."""
     return Config.load()
@@ -0,0 +1,159 @@
+"""
+Local connection daemon for PowerHA Copilot CLI.
+
+Keeps one PowerHACopilotClient (and its pooled keep-alive connections)
+open and serves requests from short-lived CLI processes over a UNIX
+socket, so each command skips the TCP/TLS handshake to the API server.
+
+Protocol: one JSON object per line in each direction.
+    request:  {"op": "get_cluster_status", "args": ["prod-cluster-01"],
+               "base_url": ..., "credentials": ...}
+    response: {"accepted": true} right away, then {"result": ...},
+              {"error": {"status_code": ..., "message": ...}} or {"refused": ...}
+
+The daemon's client is fixed at startup, so requests for a different
+server or API key (e.g. after `login`) are refused and the CLI connects
+directly instead.
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from powerha_copilot_cli.client import APIError, PowerHACopilotClient
+from powerha_copilot_cli.config import CONFIG_DIR, Config
+
+DEFAULT_SOCKET = CONFIG_DIR / "daemon.sock"
+
+# Client methods the daemon will run on behalf of the CLI
+DAEMON_OPS = frozenset({"list_clusters", "get_cluster_status", "get_cluster_health"})
+
+# Cluster listings can be large; the asyncio default line limit is 64 KiB
+_LINE_LIMIT = 16 * 1024 * 1024
+
+# Seconds to wait for the daemon to accept a request before falling back to
+# a direct one (a daemon suspended with Ctrl+Z still accepts connections)
+_ACCEPT_TIMEOUT = 1.0
+_ACCEPTED = json.dumps({"accepted": True}).encode() + b"\n"
+
+
+async def serve(config: Config, socket_path: Path = DEFAULT_SOCKET) -> None:
+    """Run the daemon until cancelled."""
+    if await _is_running(socket_path):
+        raise RuntimeError(f"A daemon is already listening on {socket_path}")
+    socket_path.unlink(missing_ok=True)
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    identity = _identity(config)
+
+    async with PowerHACopilotClient(config) as client:
+
+        async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            try:
+                line = await reader.readline()
+                if line:
+                    writer.write(_ACCEPTED)
+                    reply = await _dispatch(client, identity, line)
+                    writer.write(json.dumps(reply).encode() + b"\n")
+                    await writer.drain()
+            finally:
+                writer.close()
+
+        # The socket carries the user's API credentials: owner-only access
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(
+                handle, path=str(socket_path), limit=_LINE_LIMIT
+            )
+        finally:
+            os.umask(old_umask)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+async def call(socket_path: str, config: Config, op: str, *args: Any) -> Any:
+    """
+    Run a client method through the daemon.
+
+    Raises:
+        OSError: If no daemon is listening on socket_path, it serves a
+            different server or API key than config, or it doesn't answer
+            in time (TimeoutError)
+        APIError: If the API request failed
+    """
+    base_url, credentials = _identity(config)
+    request = {"op": op, "args": list(args), "base_url": base_url, "credentials": credentials}
+
+    reader, writer = await _wait(
+        asyncio.open_unix_connection(socket_path, limit=_LINE_LIMIT), _ACCEPT_TIMEOUT
+    )
+    try:
+        writer.write(json.dumps(request).encode() + b"\n")
+        await _wait(writer.drain(), _ACCEPT_TIMEOUT)
+        if await _wait(reader.readline(), _ACCEPT_TIMEOUT) != _ACCEPTED:
+            raise ConnectionResetError(f"Daemon at {socket_path} did not accept the request")
+        # The daemon is now making the API request on our behalf
+        line = await _wait(reader.readline(), config.timeout + _ACCEPT_TIMEOUT)
+    finally:
+        writer.close()
+
+    if not line:
+        raise ConnectionResetError(f"Daemon at {socket_path} closed the connection")
+
+    reply = json.loads(line)
+    if "refused" in reply:
+        raise ConnectionRefusedError(reply["refused"])
+    if "error" in reply:
+        raise APIError(**reply["error"])
+    return reply["result"]
+
+
+async def _dispatch(client: PowerHACopilotClient, identity: tuple, line: bytes) -> dict:
+    """Decode one request line and run it against the shared client."""
+    try:
+        request = json.loads(line)
+        op = request["op"]
+        args = request.get("args", [])
+        caller = (request["base_url"], request["credentials"])
+    except (ValueError, KeyError, TypeError):
+        return {"error": {"status_code": 400, "message": "Malformed daemon request"}}
+
+    if caller != identity:
+        return {"refused": "Daemon is serving a different server or API key; restart it"}
+
+    if op not in DAEMON_OPS:
+        return {"error": {"status_code": 400, "message": f"Unsupported daemon op: {op}"}}
+
+    try:
+        return {"result": await getattr(client, op)(*args)}
+    except APIError as e:
+        return {"error": {"status_code": e.status_code, "message": e.message, "details": e.details}}
+
+
+async def _wait(aw, timeout: float):
+    """asyncio.wait_for, raising the builtin TimeoutError (an OSError) on 3.10 too."""
+    try:
+        return await asyncio.wait_for(aw, timeout)
+    except asyncio.TimeoutError:
+        raise TimeoutError("Timed out waiting for the daemon") from None
+
+
+def _identity(config: Config) -> tuple:
+    """Server URL and a fingerprint of the API key, to match caller and daemon."""
+    return config.base_url, config.get_api_key_fingerprint()
+
+
+async def _is_running(socket_path: Path) -> bool:
+    """Check whether something already accepts connections on socket_path."""
+    try:
+        _, writer = await asyncio.open_unix_connection(str(socket_path))
+    except OSError:
+        return False
+    writer.close()
+    return True
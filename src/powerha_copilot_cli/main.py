@@ -4,27 +4,168 @@ PowerHA Copilot CLI - Main entry point.
 A rich terminal interface for PowerHA Copilot.
 """
 
-import asyncio
+import atexit
+import contextlib
+import json
+import os
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.markdown import Markdown
 from rich.prompt import Prompt, Confirm
-from rich.live import Live
-from rich.spinner import Spinner
 from rich.text import Text
 
 from powerha_copilot_cli import __version__
-from powerha_copilot_cli.config import Config, get_config
-from powerha_copilot_cli.client import PowerHACopilotClient, APIError
+from powerha_copilot_cli.config import CONFIG_FILE, Config, get_config
+from powerha_copilot_cli.client import PowerHACopilotClient, APIError, aclose_shared_client
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+if TYPE_CHECKING:
+    import asyncio
 
 
 console = Console()
 
+# Event loop shared by every async call made from this process
+_loop: Optional["asyncio.AbstractEventLoop"] = None
+
+# Cleared by --no-spinner for this run only; the 'spinner' setting persists
+_spinners_enabled = True
+
+
+def _new_event_loop() -> "asyncio.AbstractEventLoop":
+    """Create an event loop, preferring uvloop when it is installed."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def run_sync(coro):
+    """Run a coroutine to completion on the shared event loop."""
+    # asyncio is imported on first use so --help/--version don't pay for it
+    import asyncio
+
+    global _loop
+    if _loop is None:
+        _loop = _new_event_loop()
+        asyncio.set_event_loop(_loop)
+        atexit.register(_close_loop)
+
+    task = _loop.create_task(coro)
+    try:
+        return _loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        # Don't leave the interrupted request pending on the shared loop
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            _loop.run_until_complete(task)
+        raise
+
+
+def _close_loop() -> None:
+    """Close pooled connections, then the shared event loop (atexit hook)."""
+    with contextlib.suppress(Exception):
+        _loop.run_until_complete(aclose_shared_client())
+    _loop.close()
+
+
+async def call_api(config: Config, op: str, *args: Any, use_cache: bool = False) -> Any:
+    """
+    Run a client method, through the local daemon when one is configured.
+
+    With use_cache, a response cached within the last second is returned
+    instead of making the request, and fresh responses are cached.
+    """
+    if use_cache:
+        from powerha_copilot_cli import cache
+
+        cached = cache.load(config, op, *args)
+        if cached is not None:
+            return cached
+
+    result = await _call_api(config, op, *args)
+
+    if use_cache:
+        cache.store(config, op, *args, data=result)
+    return result
+
+
+async def _call_api(config: Config, op: str, *args: Any) -> Any:
+    """Run a client method without caching."""
+    if config.daemon_socket:
+        from powerha_copilot_cli import daemon
+
+        try:
+            return await daemon.call(config.daemon_socket, config, op, *args)
+        except OSError:
+            pass  # daemon not running or serving another server/key; connect directly
+
+    async with PowerHACopilotClient(config) as client:
+        return await getattr(client, op)(*args)
+
+
+def _status(message: str):
+    """Spinner context, or a no-op when output isn't a terminal or spinners are off."""
+    if console.is_terminal and _spinners_enabled and get_config().spinner:
+        return console.status(message)
+    return contextlib.nullcontext()
+
+
+def _dump_json(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+    return json.dumps(data, indent=2)
+
+
+def _compact_json(data: Any) -> bytes:
+    """Serialize data as unindented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data)
+
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _write_json_items(items: list, lines: bool = False) -> None:
+    """
+    Write a list to stdout one element at a time, bypassing Rich.
+
+    Args:
+        items: Elements to serialize
+        lines: Write newline-delimited JSON instead of a single array
+    """
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    try:
+        if lines:
+            for item in items:
+                out.write(_compact_json(item))
+                out.write(b"\n")
+        else:
+            out.write(b"[")
+            for i, item in enumerate(items):
+                if i:
+                    out.write(b",")
+                out.write(_compact_json(item))
+            out.write(b"]\n")
+        out.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`): that's the end of output.
+        # Point stdout at devnull so the flush at exit doesn't raise again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
 
 # =============================================================================
 # CLI Group
@@ -32,8 +173,9 @@ console = Console()
 
 @click.group(invoke_without_command=True)
 @click.option("--version", is_flag=True, help="Show version")
+@click.option("--no-spinner", is_flag=True, help="Disable progress spinners")
 @click.pass_context
-def main(ctx, version):
+def main(ctx, version, no_spinner):
     """
     PowerHA Copilot CLI - AI-powered high availability cluster management.
 
@@ -52,6 +194,10 @@ def main(ctx, version):
         console.print(f"[bold blue]PowerHA Copilot CLI[/] v{__version__}")
         return
 
+    if no_spinner:
+        global _spinners_enabled
+        _spinners_enabled = False
+
     if ctx.invoked_subcommand is None:
         # No command specified, show interactive mode
         ctx.invoke(chat)
@@ -70,6 +216,7 @@ def login(api_key: Optional[str], url: Optional[str]):
 
     if url:
         config.api_url = url
+        config.daemon_socket = None  # a running daemon still targets the old server
         config.save()
 
     console.print(Panel.fit(
@@ -92,13 +239,14 @@ def login(api_key: Optional[str], url: Optional[str]):
         async with PowerHACopilotClient(config) as client:
             return await client.login_with_api_key(api_key)
 
-    with console.status("[bold green]Authenticating..."):
+    with _status("[bold green]Authenticating..."):
         try:
-            result = asyncio.run(do_login())
+            result = run_sync(do_login())
             user = result.get("user", {})
             console.print(f"\n[green]✓[/] Logged in as [bold]{user.get('username', 'user')}[/]")
-            if user.get("organization"):
-                console.print(f"  Organization: {user['organization']}")
+            organization = user.get("organization")
+            if organization:
+                console.print(f"  Organization: {organization}")
         except APIError as e:
             console.print(f"\n[red]✗[/] Login failed: {e.message}")
             sys.exit(1)
@@ -114,10 +262,19 @@ def logout():
         return
 
     if Confirm.ask("Are you sure you want to log out?"):
+        config.daemon_socket = None  # a running daemon still holds the old API key
         config.clear_credentials()
         console.print("[green]✓[/] Logged out successfully.")
 
 
+_WHOAMI_FIELDS = (
+    ("Username", "username"),
+    ("Email", "email"),
+    ("Organization", "organization"),
+    ("Role", "role"),
+)
+
+
 @main.command()
 def whoami():
     """Show current user information."""
@@ -132,17 +289,15 @@ def whoami():
             return await client.whoami()
 
     try:
-        result = asyncio.run(get_user())
+        result = run_sync(get_user())
         user = result.get("user", {})
 
         table = Table(show_header=False, box=None)
         table.add_column("Key", style="bold")
         table.add_column("Value")
 
-        table.add_row("Username", user.get("username", "N/A"))
-        table.add_row("Email", user.get("email", "N/A"))
-        table.add_row("Organization", user.get("organization", "N/A"))
-        table.add_row("Role", user.get("role", "N/A"))
+        for label, key in _WHOAMI_FIELDS:
+            table.add_row(label, user.get(key, "N/A"))
 
         console.print(Panel(table, title="[bold]Current User[/]", border_style="blue"))
 
@@ -167,35 +322,40 @@ def chat(no_stream: bool):
         border_style="blue"
     ))
 
-    if not config.is_authenticated():
+    authenticated = config.is_authenticated()
+    if not authenticated:
         console.print("\n[yellow]⚠ Not authenticated.[/] Some features may be limited.")
         console.print("  Run [bold]powerha login[/] for full access.\n")
 
     conversation_id = None
     use_streaming = config.streaming and not no_stream
 
-    while True:
-        try:
-            # Get user input
-            console.print()
-            user_input = Prompt.ask("[bold green]You[/]")
+    # One open client for the whole session, so the HTTP connection pool
+    # survives between turns.
+    session = contextlib.AsyncExitStack()
+    client = run_sync(session.enter_async_context(PowerHACopilotClient(config)))
 
-            if not user_input.strip():
-                continue
+    try:
+        while True:
+            try:
+                # Get user input
+                console.print()
+                user_input = Prompt.ask("[bold green]You[/]")
 
-            if user_input.lower() in ("exit", "quit", "bye", "q"):
-                console.print("\n[dim]Goodbye![/]")
-                break
+                if not user_input.strip():
+                    continue
+
+                if user_input.lower() in ("exit", "quit", "bye", "q"):
+                    console.print("\n[dim]Goodbye![/]")
+                    break
 
-            # Handle local commands
-            if user_input.startswith("/"):
-                handle_slash_command(user_input)
-                continue
+                # Handle local commands
+                if user_input.startswith("/"):
+                    handle_slash_command(user_input, client, authenticated)
+                    continue
 
-            # Send to API
-            async def send_message():
-                nonlocal conversation_id
-                async with PowerHACopilotClient(config) as client:
+                # Send to API
+                async def send_message():
                     if use_streaming:
                         console.print("[bold blue]Copilot[/]: ", end="")
                         full_response = ""
@@ -207,36 +367,38 @@ def chat(no_stream: bool):
                     else:
                         return await client.chat(user_input, conversation_id)
 
-            try:
-                if use_streaming:
-                    result = asyncio.run(send_message())
-                else:
-                    with console.status("[bold blue]Thinking..."):
-                        result = asyncio.run(send_message())
+                try:
+                    if use_streaming:
+                        result = run_sync(send_message())
+                    else:
+                        with _status("[bold blue]Thinking..."):
+                            result = run_sync(send_message())
 
-                    # Display response
-                    response = result.get("response", result.get("message", ""))
-                    console.print(f"[bold blue]Copilot[/]: {response}")
+                        # Display response
+                        response = result.get("response", result.get("message", ""))
+                        console.print(f"[bold blue]Copilot[/]: {response}")
 
-                # Update conversation ID for context
-                if "conversation_id" in result:
-                    conversation_id = result["conversation_id"]
+                    # Update conversation ID for context
+                    if "conversation_id" in result:
+                        conversation_id = result["conversation_id"]
 
-                # Show any actions taken
-                if "actions" in result:
-                    for action in result["actions"]:
-                        console.print(f"  [dim]→ {action}[/]")
+                    # Show any actions taken
+                    if "actions" in result:
+                        for action in result["actions"]:
+                            console.print(f"  [dim]→ {action}[/]")
 
-            except APIError as e:
-                console.print(f"[red]Error:[/] {e.message}")
+                except APIError as e:
+                    console.print(f"[red]Error:[/] {e.message}")
 
-        except KeyboardInterrupt:
-            console.print("\n[dim]Use 'exit' to quit.[/]")
-        except EOFError:
-            break
+            except KeyboardInterrupt:
+                console.print("\n[dim]Use 'exit' to quit.[/]")
+            except EOFError:
+                break
+    finally:
+        run_sync(session.aclose())
 
 
-def handle_slash_command(command: str):
+def handle_slash_command(command: str, client: PowerHACopilotClient, authenticated: bool):
     """Handle slash commands in chat."""
     parts = command.split()
     cmd = parts[0].lower()
@@ -255,40 +417,37 @@ def handle_slash_command(command: str):
     elif cmd == "/clear":
         console.clear()
     elif cmd == "/clusters":
-        asyncio.run(show_clusters())
+        run_sync(show_clusters(client))
     elif cmd == "/status":
-        show_status()
+        show_status(client.config, authenticated)
     elif cmd in ("/exit", "/quit"):
         raise EOFError()
     else:
         console.print(f"[yellow]Unknown command: {cmd}[/]")
 
 
-async def show_clusters():
+async def show_clusters(client: PowerHACopilotClient):
     """Show cluster list in chat."""
-    config = get_config()
     try:
-        async with PowerHACopilotClient(config) as client:
-            clusters = await client.list_clusters()
-            if clusters:
-                table = Table(title="Clusters")
-                table.add_column("ID")
-                table.add_column("Name")
-                table.add_column("Status")
-                for c in clusters:
-                    table.add_row(c["id"], c["name"], c["status"])
-                console.print(table)
-            else:
-                console.print("[yellow]No clusters found.[/]")
+        clusters = await client.list_clusters()
+        if clusters:
+            table = Table(title="Clusters")
+            table.add_column("ID")
+            table.add_column("Name")
+            table.add_column("Status")
+            for c in clusters:
+                table.add_row(c["id"], c["name"], c["status"])
+            console.print(table)
+        else:
+            console.print("[yellow]No clusters found.[/]")
     except APIError as e:
         console.print(f"[red]Error:[/] {e.message}")
 
 
-def show_status():
+def show_status(config: Config, authenticated: bool):
     """Show connection status."""
-    config = get_config()
     console.print(f"Server: [cyan]{config.api_url}[/]")
-    console.print(f"Authenticated: {'[green]Yes[/]' if config.is_authenticated() else '[red]No[/]'}")
+    console.print(f"Authenticated: {'[green]Yes[/]' if authenticated else '[red]No[/]'}")
     if config.username:
         console.print(f"User: {config.username}")
 
@@ -297,6 +456,52 @@ def show_status():
 # Cluster Commands
 # =============================================================================
 
+# Status -> style, with the fallback style for anything not listed
+_CLUSTER_STATUS_STYLE = {"online": "green", "offline": "red"}
+_NODE_STATUS_STYLE = {"active": "green", "standby": "yellow"}
+
+
+# Panel bodies for `cluster status` / `cluster health`
+_STATUS_PANEL_TMPL = "[bold]{name}[/]\nStatus: {status}"
+_HEALTH_PANEL_TMPL = "[bold]Health Score: [{color}]{score}/100[/][/]\nStatus: {status}"
+
+# (header, style) column layouts. Rich columns accumulate their cells, so
+# tables can't be shared between renders; only the layout is.
+_CLUSTER_COLUMNS = (
+    ("ID", "cyan"),
+    ("Name", "bold"),
+    ("Status", None),
+    ("Nodes", None),
+    ("Resource Groups", None),
+)
+_NODE_COLUMNS = (
+    ("Name", None),
+    ("Hostname", None),
+    ("Status", None),
+    ("Primary", None),
+    ("CPU %", None),
+    ("Memory %", None),
+)
+
+
+def _new_table(columns: tuple, **kwargs: Any) -> Table:
+    """Create a table with the given (header, style) columns."""
+    table = Table(**kwargs)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+def _cluster_status_text(status: str) -> Text:
+    """Styled cell for a cluster status."""
+    return Text(status, style=_CLUSTER_STATUS_STYLE.get(status, "yellow"))
+
+
+def _node_status_text(status: str) -> Text:
+    """Styled cell for a node status."""
+    return Text(status, style=_NODE_STATUS_STYLE.get(status, "red"))
+
+
 @main.group()
 def cluster():
     """Cluster management commands."""
@@ -304,74 +509,143 @@ def cluster():
 
 
 @cluster.command("list")
-@click.option("--format", "fmt", type=click.Choice(["table", "json"]), default="table")
-def cluster_list(fmt: str):
+@click.option(
+    "--format", "fmt", type=click.Choice(["table", "json", "ndjson"]), default="table"
+)
+@click.option("--no-cache", is_flag=True, help="Always fetch fresh data from the server")
+def cluster_list(fmt: str, no_cache: bool):
     """List all PowerHA clusters."""
     config = get_config()
 
-    async def get_clusters():
-        async with PowerHACopilotClient(config) as client:
-            return await client.list_clusters()
-
-    with console.status("[bold green]Loading clusters..."):
+    with _status("[bold green]Loading clusters..."):
         try:
-            clusters = asyncio.run(get_clusters())
+            clusters = run_sync(call_api(config, "list_clusters", use_cache=not no_cache))
         except APIError as e:
             console.print(f"[red]Error:[/] {e.message}")
             return
 
+    if fmt == "ndjson":
+        _write_json_items(clusters, lines=True)
+        return
+
     if fmt == "json":
-        import json
-        console.print_json(json.dumps(clusters, indent=2))
+        if console.is_terminal:
+            console.print_json(_dump_json(clusters))
+        else:
+            _write_json_items(clusters)
         return
 
     if not clusters:
         console.print("[yellow]No clusters found.[/]")
         return
 
-    table = Table(title="PowerHA Clusters")
-    table.add_column("ID", style="cyan")
-    table.add_column("Name", style="bold")
-    table.add_column("Status")
-    table.add_column("Nodes")
-    table.add_column("Resource Groups")
-
-    for cluster in clusters:
-        status = cluster.get("status", "unknown")
-        status_style = "green" if status == "online" else "red" if status == "offline" else "yellow"
-
-        table.add_row(
-            cluster.get("id", ""),
-            cluster.get("name", ""),
-            f"[{status_style}]{status}[/]",
-            str(cluster.get("node_count", 0)),
-            str(cluster.get("resource_groups", 0)),
-        )
+    table = _new_table(_CLUSTER_COLUMNS, title="PowerHA Clusters")
+
+    rows = [_cluster_row(c) for c in clusters]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
 
+def _cluster_row(cluster: Dict[str, Any]) -> tuple:
+    """Table cells for one cluster in `cluster list`."""
+    get = cluster.get
+    return (
+        get("id", ""),
+        get("name", ""),
+        _cluster_status_text(get("status", "unknown")),
+        str(get("node_count", 0)),
+        str(get("resource_groups", 0)),
+    )
+
+
+def _node_row(node: Dict[str, Any]) -> tuple:
+    """Table cells for one node in `cluster status`."""
+    get = node.get
+    return (
+        get("name", ""),
+        get("hostname", ""),
+        _node_status_text(get("status", "unknown")),
+        "✓" if get("is_primary") else "",
+        format(get("cpu_usage", 0), ".1f"),
+        format(get("memory_usage", 0), ".1f"),
+    )
+
+
 @cluster.command("status")
 @click.argument("cluster_id")
-def cluster_status(cluster_id: str):
+@click.option("--no-cache", is_flag=True, help="Always fetch fresh data from the server")
+def cluster_status(cluster_id: str, no_cache: bool):
     """Get detailed status of a cluster."""
     config = get_config()
 
-    async def get_status():
+    with _status(f"[bold green]Getting status for {cluster_id}..."):
+        try:
+            status = run_sync(
+                call_api(config, "get_cluster_status", cluster_id, use_cache=not no_cache)
+            )
+        except APIError as e:
+            console.print(f"[red]Error:[/] {e.message}")
+            return
+
+    print_cluster_status(cluster_id, status)
+
+
+@cluster.command("health")
+@click.argument("cluster_id")
+@click.option("--no-cache", is_flag=True, help="Always fetch fresh data from the server")
+def cluster_health(cluster_id: str, no_cache: bool):
+    """Check health of a cluster."""
+    config = get_config()
+
+    with _status(f"[bold green]Checking health of {cluster_id}..."):
+        try:
+            health = run_sync(
+                call_api(config, "get_cluster_health", cluster_id, use_cache=not no_cache)
+            )
+        except APIError as e:
+            console.print(f"[red]Error:[/] {e.message}")
+            return
+
+    print_cluster_health(cluster_id, health)
+
+
+@cluster.command("overview")
+@click.argument("cluster_id")
+def cluster_overview(cluster_id: str):
+    """Show status and health of a cluster together."""
+    config = get_config()
+
+    async def get_overview():
+        import asyncio
+
         async with PowerHACopilotClient(config) as client:
-            return await client.get_cluster_status(cluster_id)
+            return await asyncio.gather(
+                client.get_cluster_status(cluster_id),
+                client.get_cluster_health(cluster_id),
+            )
 
-    with console.status(f"[bold green]Getting status for {cluster_id}..."):
+    with _status(f"[bold green]Getting overview of {cluster_id}..."):
         try:
-            status = asyncio.run(get_status())
+            status, health = run_sync(get_overview())
         except APIError as e:
             console.print(f"[red]Error:[/] {e.message}")
             return
 
+    print_cluster_status(cluster_id, status)
+    console.print()
+    print_cluster_health(cluster_id, health)
+
+
+def print_cluster_status(cluster_id: str, status: Dict[str, Any]):
+    """Render a cluster status response."""
     # Display cluster info
     console.print(Panel(
-        f"[bold]{status.get('name', cluster_id)}[/]\n"
-        f"Status: {status.get('status', 'unknown')}",
+        _STATUS_PANEL_TMPL.format(
+            name=status.get("name", cluster_id),
+            status=status.get("status", "unknown"),
+        ),
         title=f"Cluster: {cluster_id}",
         border_style="blue"
     ))
@@ -379,26 +653,10 @@ def cluster_status(cluster_id: str):
     # Display nodes
     nodes = status.get("nodes", [])
     if nodes:
-        node_table = Table(title="Nodes")
-        node_table.add_column("Name")
-        node_table.add_column("Hostname")
-        node_table.add_column("Status")
-        node_table.add_column("Primary")
-        node_table.add_column("CPU %")
-        node_table.add_column("Memory %")
+        node_table = _new_table(_NODE_COLUMNS, title="Nodes")
 
         for node in nodes:
-            node_status = node.get("status", "unknown")
-            status_style = "green" if node_status == "active" else "yellow" if node_status == "standby" else "red"
-
-            node_table.add_row(
-                node.get("name", ""),
-                node.get("hostname", ""),
-                f"[{status_style}]{node_status}[/]",
-                "✓" if node.get("is_primary") else "",
-                f"{node.get('cpu_usage', 0):.1f}",
-                f"{node.get('memory_usage', 0):.1f}",
-            )
+            node_table.add_row(*_node_row(node))
 
         console.print(node_table)
 
@@ -408,30 +666,18 @@ def cluster_status(cluster_id: str):
         console.print(f"\n[bold]Resource Groups:[/] {', '.join(rgs)}")
 
 
-@cluster.command("health")
-@click.argument("cluster_id")
-def cluster_health(cluster_id: str):
-    """Check health of a cluster."""
-    config = get_config()
-
-    async def get_health():
-        async with PowerHACopilotClient(config) as client:
-            return await client.get_cluster_health(cluster_id)
-
-    with console.status(f"[bold green]Checking health of {cluster_id}..."):
-        try:
-            health = asyncio.run(get_health())
-        except APIError as e:
-            console.print(f"[red]Error:[/] {e.message}")
-            return
-
+def print_cluster_health(cluster_id: str, health: Dict[str, Any]):
+    """Render a cluster health response."""
     # Health score
     score = health.get("health_score", 0)
     score_color = "green" if score >= 80 else "yellow" if score >= 50 else "red"
 
     console.print(Panel(
-        f"[bold]Health Score: [{score_color}]{score}/100[/][/]\n"
-        f"Status: {health.get('health_status', 'unknown')}",
+        _HEALTH_PANEL_TMPL.format(
+            color=score_color,
+            score=score,
+            status=health.get("health_status", "unknown"),
+        ),
         title=f"Health: {cluster_id}",
         border_style=score_color
     ))
@@ -451,6 +697,43 @@ def cluster_health(cluster_id: str):
             console.print(f"  → {rec}")
 
 
+# =============================================================================
+# Daemon Commands
+# =============================================================================
+
+@main.group()
+def daemon():
+    """Local connection daemon commands."""
+    pass
+
+
+@daemon.command("start")
+def daemon_start():
+    """Run the connection daemon in the foreground (Ctrl+C to stop)."""
+    import asyncio
+
+    from powerha_copilot_cli import daemon as daemon_mod
+
+    if not hasattr(asyncio, "start_unix_server"):
+        console.print("[red]Error:[/] The daemon requires UNIX socket support.")
+        sys.exit(1)
+
+    config = get_config()
+    socket_path = daemon_mod.DEFAULT_SOCKET
+    if config.daemon_socket != str(socket_path):
+        config.daemon_socket = str(socket_path)
+        config.save()
+
+    console.print(f"[green]✓[/] Starting daemon on [cyan]{socket_path}[/]")
+    try:
+        run_sync(daemon_mod.serve(config, socket_path))
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/] {e}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[dim]Daemon stopped.[/]")
+
+
 # =============================================================================
 # Configuration Commands
 # =============================================================================
@@ -476,11 +759,12 @@ def config(url: Optional[str], theme: Optional[str], show: bool):
         table.add_row("Authenticated", "Yes" if cfg.is_authenticated() else "No")
 
         console.print(table)
-        console.print(f"\n[dim]Config file: {cfg.CONFIG_FILE}[/]")
+        console.print(f"\n[dim]Config file: {CONFIG_FILE}[/]")
         return
 
     if url:
         cfg.api_url = url
+        cfg.daemon_socket = None  # a running daemon still targets the old server
         console.print(f"[green]✓[/] API URL set to: {url}")
 
     if theme:
@@ -488,6 +772,7 @@ def config(url: Optional[str], theme: Optional[str], show: bool):
         console.print(f"[green]✓[/] Theme set to: {theme}")
 
     cfg.save()
+    get_config.cache_clear()
 
 
 # =============================================================================